@@ -42,6 +42,7 @@ print_help() {
     print_command "  cleanup           Full cleanup (stop processes, clear cache)"
     print_command "  quick-cleanup     Quick cleanup (stop processes only)"
     print_command "  health            Run health checks"
+    print_command "  watch             Keep refreshing statuses until interrupted"
     echo
     echo "Utility Commands:"
     print_command "  install-deps      Install all dependencies"
@@ -176,6 +177,9 @@ main() {
         health)
             python3 scripts/development/manage-dev-resources.py health
             ;;
+        watch)
+            python3 scripts/development/manage-dev-resources.py watch
+            ;;
         install-deps)
             install_deps
             ;;
@@ -7,15 +7,39 @@ including port status, service status, and resource monitoring.
 """
 
 import json
+import re
 import subprocess
 import sys
 import os
 import time
 import socket
+import errno
+import selectors
+import shlex
 import psutil
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Set, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def load_json(path: Union[str, Path]) -> Any:
+    """Load a JSON file, using orjson when it is available."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+def dump_json(obj: Any, path: Union[str, Path]) -> None:
+    """Write obj as indented JSON, using orjson when it is available."""
+    if orjson:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(obj, f, indent=2, ensure_ascii=False)
 
 # Colors for output
 class Colors:
@@ -28,16 +52,28 @@ class Colors:
     WHITE = '\033[1;37m'
     NC = '\033[0m'  # No Color
 
+if not sys.stdout.isatty():
+    # Don't write escape codes into redirected output
+    for _name in ('RED', 'GREEN', 'YELLOW', 'BLUE', 'PURPLE', 'CYAN', 'WHITE', 'NC'):
+        setattr(Colors, _name, '')
+
+def write_lines(lines: List[str]) -> None:
+    """Write a block of report lines with a single write call."""
+    sys.stdout.write('\n'.join(lines) + '\n')
+
 class DevResourcesManager:
+    # Services that run outside the dev environment and have no process check
+    EXTERNAL_SERVICES = {'obs_studio'}
+    
     def __init__(self, config_file: str = "config/dev_resources.json"):
         self.config_file = Path(config_file)
         self.config = self.load_config()
+        self.index_ports()
         
     def load_config(self) -> Dict[str, Any]:
         """Load the development resources configuration."""
         try:
-            with open(self.config_file, 'r') as f:
-                return json.load(f)
+            return load_json(self.config_file)
         except FileNotFoundError:
             print(f"{Colors.RED}Error: Configuration file {self.config_file} not found.{Colors.NC}")
             sys.exit(1)
@@ -45,49 +81,112 @@ class DevResourcesManager:
             print(f"{Colors.RED}Error: Invalid JSON in configuration file: {e}{Colors.NC}")
             sys.exit(1)
     
+    def index_ports(self) -> None:
+        """Index the port configurations by port number."""
+        self.ports_by_number = {}
+        for port_config in self.config['ports'].values():
+            # Keep the first entry for a port, as the previous linear scan did
+            self.ports_by_number.setdefault(port_config['port'], port_config)
+    
     def save_config(self) -> None:
         """Save the current configuration to file."""
         try:
             # Update last_updated timestamp
             self.config['development_environment']['last_updated'] = datetime.now().isoformat()
             
-            with open(self.config_file, 'w') as f:
-                json.dump(self.config, f, indent=2)
+            dump_json(self.config, self.config_file)
+            self.index_ports()
             print(f"{Colors.GREEN}Configuration saved successfully.{Colors.NC}")
         except Exception as e:
             print(f"{Colors.RED}Error saving configuration: {e}{Colors.NC}")
     
     def check_port_status(self, port: int) -> bool:
         """Check if a port is in use."""
+        return self.check_ports_batch([port]).get(port, False)
+    
+    def check_ports_batch(self, ports: List[int], timeout: float = 1.0) -> Dict[int, bool]:
+        """Check several ports at once, sharing a single timeout."""
+        results = {port: False for port in ports}
+        in_progress = (errno.EINPROGRESS, errno.EWOULDBLOCK, getattr(errno, 'WSAEWOULDBLOCK', errno.EWOULDBLOCK))
+        selector = selectors.DefaultSelector()
         try:
-            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as s:
-                s.settimeout(1)
-                result = s.connect_ex(('localhost', port))
-                return result == 0
-        except Exception:
-            return False
+            for port in ports:
+                s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+                try:
+                    s.setblocking(False)
+                    result = s.connect_ex(('localhost', port))
+                except Exception:
+                    s.close()
+                    continue
+                if result in in_progress:
+                    selector.register(s, selectors.EVENT_WRITE, port)
+                else:
+                    results[port] = result == 0
+                    s.close()
+            
+            deadline = time.monotonic() + timeout
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                for key, _ in selector.select(remaining):
+                    s = key.fileobj
+                    results[key.data] = s.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0
+                    selector.unregister(s)
+                    s.close()
+        finally:
+            for key in list(selector.get_map().values()):
+                key.fileobj.close()
+            selector.close()
+        return results
     
-    def check_process_status(self, process_pattern: str) -> bool:
-        """Check if a process is running."""
+    def get_process_cmdlines(self) -> List[str]:
+        """Take a snapshot of the command lines of all running processes."""
+        cmdlines = []
         try:
-            for proc in psutil.process_iter(['pid', 'name', 'cmdline']):
+            for proc in psutil.process_iter(['cmdline']):
                 try:
-                    cmdline = ' '.join(proc.info['cmdline']) if proc.info['cmdline'] else ''
-                    if process_pattern in cmdline:
-                        return True
+                    cmdline = proc.info['cmdline']
+                    if cmdline:
+                        cmdlines.append(' '.join(cmdline))
                 except (psutil.NoSuchProcess, psutil.AccessDenied):
                     continue
-            return False
         except Exception:
-            return False
+            pass
+        return cmdlines
+    
+    def check_process_status(self, process_pattern: str, cmdlines: Optional[List[str]] = None) -> bool:
+        """Check if a process is running."""
+        if cmdlines is None:
+            cmdlines = self.get_process_cmdlines()
+        return any(process_pattern in cmdline for cmdline in cmdlines)
+    
+    def find_running_commands(self, patterns: List[str], cmdlines: List[str]) -> Set[str]:
+        """Return the patterns that occur in any of the given command lines."""
+        if not patterns:
+            return set()
+        unique = set(patterns)
+        # The union only picks out candidate command lines; matches can overlap,
+        # so each pattern is confirmed with a plain substring test
+        union = re.compile('|'.join(re.escape(p) for p in unique))
+        found = set()
+        for cmdline in cmdlines:
+            if not union.search(cmdline):
+                continue
+            found.update(p for p in unique - found if p in cmdline)
+            if len(found) == len(unique):
+                break
+        return found
     
     def update_port_statuses(self) -> None:
         """Update the status of all ports in the configuration."""
         print(f"{Colors.BLUE}Checking port statuses...{Colors.NC}")
         
+        ports_in_use = self.check_ports_batch([p['port'] for p in self.config['ports'].values()])
+        
         for port_name, port_config in self.config['ports'].items():
             port_num = port_config['port']
-            is_in_use = self.check_port_status(port_num)
+            is_in_use = ports_in_use[port_num]
             
             if is_in_use:
                 port_config['status'] = 'in_use'
@@ -100,28 +199,59 @@ class DevResourcesManager:
         """Update the status of all services in the configuration."""
         print(f"{Colors.BLUE}Checking service statuses...{Colors.NC}")
         
-        for service_name, service_config in self.config['services'].items():
-            if service_name == 'obs_studio':
-                # OBS Studio is external, skip process check
-                continue
-                
-            command = service_config.get('command', '')
-            if command:
-                is_running = self.check_process_status(command)
-                
-                if is_running:
-                    service_config['status'] = 'running'
-                    print(f"  {Colors.GREEN}✅ {service_config['name']}: RUNNING{Colors.NC}")
-                else:
-                    service_config['status'] = 'stopped'
-                    print(f"  {Colors.RED}❌ {service_config['name']}: STOPPED{Colors.NC}")
+        services = {
+            name: config for name, config in self.config['services'].items()
+            if name not in self.EXTERNAL_SERVICES and config.get('command', '')
+        }
+        if not services:
+            return
+        
+        running = self.find_running_commands(
+            [config['command'] for config in services.values()],
+            self.get_process_cmdlines()
+        )
+        
+        for service_name, service_config in services.items():
+            if service_config['command'] in running:
+                service_config['status'] = 'running'
+                print(f"  {Colors.GREEN}✅ {service_config['name']}: RUNNING{Colors.NC}")
+            else:
+                service_config['status'] = 'stopped'
+                print(f"  {Colors.RED}❌ {service_config['name']}: STOPPED{Colors.NC}")
+    
+    def get_status_snapshot(self) -> tuple:
+        """Return the current port and service statuses for change detection."""
+        return (
+            tuple((name, config['status']) for name, config in self.config['ports'].items()),
+            tuple((name, config['status']) for name, config in self.config['services'].items())
+        )
+    
+    def watch(self, min_interval: float = 2.5, max_interval: float = 15.0) -> None:
+        """Refresh statuses periodically, backing off while nothing changes."""
+        interval = min_interval
+        previous = None
+        next_run = time.monotonic()
+        
+        while True:
+            print(f"{Colors.CYAN}[{datetime.now().strftime('%H:%M:%S')}] Refreshing statuses...{Colors.NC}")
+            self.update_port_statuses()
+            self.update_service_statuses()
+            print()
+            
+            snapshot = self.get_status_snapshot()
+            if snapshot == previous:
+                interval = min(interval * 1.5, max_interval)
+            else:
+                interval = min_interval
+            previous = snapshot
+            
+            # Schedule against monotonic deadlines so ticks do not drift
+            next_run = max(next_run + interval, time.monotonic())
+            time.sleep(max(0.0, next_run - time.monotonic()))
     
     def get_port_info(self, port: int) -> Optional[Dict[str, Any]]:
         """Get information about a specific port."""
-        for port_name, port_config in self.config['ports'].items():
-            if port_config['port'] == port:
-                return port_config
-        return None
+        return self.ports_by_number.get(port)
     
     def get_service_info(self, service_name: str) -> Optional[Dict[str, Any]]:
         """Get information about a specific service."""
@@ -129,70 +259,73 @@ class DevResourcesManager:
     
     def list_ports(self) -> None:
         """List all ports and their status."""
-        print(f"{Colors.CYAN}📋 Port Configuration:{Colors.NC}")
-        print("-" * 60)
+        lines = [f"{Colors.CYAN}📋 Port Configuration:{Colors.NC}", "-" * 60]
         
         for port_name, port_config in self.config['ports'].items():
             status_icon = "✅" if port_config['status'] == 'available' else "⚠️"
             status_color = Colors.GREEN if port_config['status'] == 'available' else Colors.YELLOW
             
-            print(f"{status_icon} {port_config['service']} (Port {port_config['port']})")
-            print(f"   Protocol: {port_config['protocol']}")
-            print(f"   Status: {status_color}{port_config['status'].upper()}{Colors.NC}")
-            print(f"   Forwarded: {'Yes' if port_config['forwarded'] else 'No'}")
+            lines.append(f"{status_icon} {port_config['service']} (Port {port_config['port']})")
+            lines.append(f"   Protocol: {port_config['protocol']}")
+            lines.append(f"   Status: {status_color}{port_config['status'].upper()}{Colors.NC}")
+            lines.append(f"   Forwarded: {'Yes' if port_config['forwarded'] else 'No'}")
             if 'url' in port_config:
-                print(f"   URL: {port_config['url']}")
-            print()
+                lines.append(f"   URL: {port_config['url']}")
+            lines.append("")
+        
+        write_lines(lines)
     
     def list_services(self) -> None:
         """List all services and their status."""
-        print(f"{Colors.CYAN}🔧 Service Configuration:{Colors.NC}")
-        print("-" * 60)
+        lines = [f"{Colors.CYAN}🔧 Service Configuration:{Colors.NC}", "-" * 60]
         
         for service_name, service_config in self.config['services'].items():
             status_icon = "✅" if service_config['status'] == 'running' else "❌"
             status_color = Colors.GREEN if service_config['status'] == 'running' else Colors.RED
             
-            print(f"{status_icon} {service_config['name']}")
-            print(f"   Status: {status_color}{service_config['status'].upper()}{Colors.NC}")
+            lines.append(f"{status_icon} {service_config['name']}")
+            lines.append(f"   Status: {status_color}{service_config['status'].upper()}{Colors.NC}")
             if 'command' in service_config:
-                print(f"   Command: {service_config['command']}")
+                lines.append(f"   Command: {service_config['command']}")
             if 'directory' in service_config:
-                print(f"   Directory: {service_config['directory']}")
-            print()
+                lines.append(f"   Directory: {service_config['directory']}")
+            lines.append("")
+        
+        write_lines(lines)
     
     def show_summary(self) -> None:
         """Show a summary of the development environment."""
-        print(f"{Colors.PURPLE}🚀 reStrike VTA Development Environment Summary{Colors.NC}")
-        print("=" * 60)
+        lines = [f"{Colors.PURPLE}🚀 reStrike VTA Development Environment Summary{Colors.NC}", "=" * 60]
         
         # Environment info
         env = self.config['environment']
-        print(f"Node.js: {env['node_version']}")
-        print(f"Rust: {env['rust_version']}")
-        print(f"Cargo: {env['cargo_version']}")
-        print(f"mpv: {env['mpv_version']}")
-        print(f"Container: {env['container_type']}")
-        print(f"OS: {env['os']}")
-        print()
+        lines.append(f"Node.js: {env['node_version']}")
+        lines.append(f"Rust: {env['rust_version']}")
+        lines.append(f"Cargo: {env['cargo_version']}")
+        lines.append(f"mpv: {env['mpv_version']}")
+        lines.append(f"Container: {env['container_type']}")
+        lines.append(f"OS: {env['os']}")
+        lines.append("")
         
         # Port summary
         available_ports = sum(1 for p in self.config['ports'].values() if p['status'] == 'available')
         total_ports = len(self.config['ports'])
-        print(f"Ports: {available_ports}/{total_ports} available")
+        lines.append(f"Ports: {available_ports}/{total_ports} available")
         
         # Service summary
         running_services = sum(1 for s in self.config['services'].values() if s['status'] == 'running')
         total_services = len([s for s in self.config['services'].values() if s['status'] != 'external'])
-        print(f"Services: {running_services}/{total_services} running")
-        print()
+        lines.append(f"Services: {running_services}/{total_services} running")
+        lines.append("")
         
         # Quick status
-        print(f"{Colors.CYAN}Quick Status:{Colors.NC}")
+        lines.append(f"{Colors.CYAN}Quick Status:{Colors.NC}")
         for port_name, port_config in self.config['ports'].items():
             if port_config['auto_start']:
                 status_icon = "✅" if port_config['status'] == 'available' else "⚠️"
-                print(f"  {status_icon} {port_config['service']} (Port {port_config['port']})")
+                lines.append(f"  {status_icon} {port_config['service']} (Port {port_config['port']})")
+        
+        write_lines(lines)
     
     def run_health_check(self) -> None:
         """Run health checks for all services."""
@@ -200,16 +333,46 @@ class DevResourcesManager:
         
         health_checks = self.config['monitoring']['health_checks']
         
+        # Start every check up front so they run concurrently under one deadline
+        processes = {}
         for service, check_command in health_checks.items():
             try:
-                result = subprocess.run(check_command, shell=True, capture_output=True, text=True, timeout=10)
-                if result.returncode == 0:
+                processes[service] = subprocess.Popen(
+                    shlex.split(check_command),
+                    stdout=subprocess.DEVNULL,
+                    stderr=subprocess.PIPE,
+                    text=True
+                )
+            except Exception as e:
+                processes[service] = e
+        
+        deadline = time.monotonic() + 10
+        for service, proc in processes.items():
+            if isinstance(proc, FileNotFoundError):
+                # Missing binary: same outcome as the shell's "not found"
+                print(f"  {Colors.RED}❌ {service}: UNHEALTHY{Colors.NC}")
+                print(f"     Error: {proc}")
+                continue
+            if isinstance(proc, Exception):
+                print(f"  {Colors.RED}❌ {service}: ERROR - {proc}{Colors.NC}")
+                continue
+            try:
+                try:
+                    _, stderr = proc.communicate(timeout=max(0, deadline - time.monotonic()))
+                except subprocess.TimeoutExpired:
+                    if proc.poll() is None:
+                        proc.kill()
+                        proc.communicate()
+                        print(f"  {Colors.YELLOW}⚠️  {service}: TIMEOUT{Colors.NC}")
+                        continue
+                    # Already exited; an earlier check just used up the deadline
+                    _, stderr = proc.communicate()
+                
+                if proc.returncode == 0:
                     print(f"  {Colors.GREEN}✅ {service}: HEALTHY{Colors.NC}")
                 else:
                     print(f"  {Colors.RED}❌ {service}: UNHEALTHY{Colors.NC}")
-                    print(f"     Error: {result.stderr.strip()}")
-            except subprocess.TimeoutExpired:
-                print(f"  {Colors.YELLOW}⚠️  {service}: TIMEOUT{Colors.NC}")
+                    print(f"     Error: {stderr.strip()}")
             except Exception as e:
                 print(f"  {Colors.RED}❌ {service}: ERROR - {e}{Colors.NC}")
     
@@ -229,8 +392,7 @@ class DevResourcesManager:
         }
         
         try:
-            with open(output_file, 'w') as f:
-                json.dump(report, f, indent=2)
+            dump_json(report, output_file)
             print(f"{Colors.GREEN}Status report exported to {output_file}{Colors.NC}")
         except Exception as e:
             print(f"{Colors.RED}Error exporting report: {e}{Colors.NC}")
@@ -247,6 +409,7 @@ def show_help():
     print("  services        List all services and their status")
     print("  update          Update all statuses")
     print("  health          Run health checks")
+    print("  watch           Keep refreshing statuses until interrupted")
     print("  export [file]   Export status report (default: dev_status_report.json)")
     print("  help            Show this help message")
     print()
@@ -292,6 +455,9 @@ def main():
         elif command == "health":
             manager.run_health_check()
             
+        elif command == "watch":
+            manager.watch()
+            
         elif command == "export":
             output_file = sys.argv[2] if len(sys.argv) > 2 else "dev_status_report.json"
             manager.update_port_statuses()